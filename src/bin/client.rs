@@ -15,12 +15,25 @@ use std::{
 
 use quadropong::client::{app::App, config::Config, error::ClientError};
 
+/// Formats the log timestamp, reformatting only when the second changes
+/// since the format has second granularity anyway.
+fn format_timestamp() -> String {
+    static LAST: std::sync::Mutex<(i64, String)> = std::sync::Mutex::new((i64::MIN, String::new()));
+    let now = chrono::Local::now();
+    let second = now.timestamp();
+    let mut last = LAST.lock().unwrap_or_else(|e| e.into_inner());
+    if last.0 != second {
+        *last = (second, now.format("%Y-%m-%d %H:%M:%S").to_string());
+    }
+    last.1.clone()
+}
+
 fn setup_logger(log_path: PathBuf) -> Result<(), fern::InitError> {
     fern::Dispatch::new()
         .format(|out, message, record| {
             out.finish(format_args!(
                 "{} [{}] {}",
-                chrono::Local::now().format("%Y-%m-%d %H:%M:%S"),
+                format_timestamp(),
                 record.level(),
                 message
             ))
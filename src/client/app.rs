@@ -1,4 +1,4 @@
-use crossterm::event::{Event, EventStream, KeyEvent};
+use crossterm::event::{Event, EventStream, KeyEvent, KeyEventKind};
 use futures_util::TryStreamExt;
 use ratatui::{prelude::Backend, Terminal};
 use std::{sync::Arc, thread::sleep, time::Duration};
@@ -51,7 +51,11 @@ impl<'a, B: Backend> App<'a, B> {
                     // Process incoming events
                     maybe_event = reader.try_next() => {
                         match maybe_event {
-                            Ok(Some(Event::Key(key_event))) => {
+                            // ignore key releases so they don't trigger update
+                            // passes (or double inputs on terminals that report them)
+                            Ok(Some(Event::Key(key_event)))
+                                if key_event.kind != KeyEventKind::Release =>
+                            {
                                 let now = Instant::now();
                                 let time_since_last = now.duration_since(last_key_event_time);
 
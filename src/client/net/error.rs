@@ -28,6 +28,4 @@ pub enum UdpError {
     MsgPackDeserialization(#[from] RmpSerdeDecodeError),
     #[error("UTF-8 error: {0}")]
     Utf8(#[from] Utf8Error),
-    #[error("Invalid source")]
-    InvalidSource,
 }
@@ -1,3 +1,5 @@
+use std::sync::LazyLock;
+
 use log::info;
 use reqwest::Client;
 use serde_json;
@@ -7,6 +9,11 @@ use crate::common::{Game, JoinGameRequest, Player};
 
 use super::error::TcpError;
 
+/// One HTTP client for the whole process; a reqwest Client owns a connection
+/// pool, so building a fresh one per state transition would throw away pooled
+/// connections and redo the client setup on every menu navigation.
+static HTTP_CLIENT: LazyLock<Client> = LazyLock::new(Client::new);
+
 pub struct TcpClient {
     server_addr: String,
     client: Client,
@@ -16,7 +23,7 @@ impl TcpClient {
     pub fn new(server_addr: &str) -> Self {
         TcpClient {
             server_addr: server_addr.to_string(),
-            client: Client::new(),
+            client: HTTP_CLIENT.clone(),
         }
     }
 
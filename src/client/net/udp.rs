@@ -6,7 +6,6 @@ use super::error::UdpError;
 
 #[derive(Debug)]
 pub struct UdpClient {
-    server_addr: std::net::SocketAddr,
     socket: tokio::net::UdpSocket,
 }
 
@@ -30,28 +29,51 @@ impl UdpClient {
             std::io::Error::new(std::io::ErrorKind::InvalidInput, "DNS resolution failed")
         })?;
 
-        // Then create the socket
+        // Then create the socket; connecting it fixes the destination once,
+        // so sends skip the per-packet address lookup and the kernel drops
+        // datagrams that do not come from the server
         let socket = std::net::UdpSocket::bind("0.0.0.0:0")?;
+        socket.connect(server_addr)?;
         socket.set_nonblocking(true)?;
 
         Ok(Self {
-            server_addr,
             socket: tokio::net::UdpSocket::from_std(socket)?,
         })
     }
 
     pub async fn send_client_input(&self, client_input: ClientInput) -> Result<(), UdpError> {
         let serialized = rmp_serde::to_vec(&client_input)?;
-        self.socket.send_to(&serialized, &self.server_addr).await?;
+        self.send_raw(&serialized).await
+    }
+
+    /// Sends an already serialized packet, so hot paths can reuse
+    /// pre-encoded buffers instead of serializing on every send.
+    pub async fn send_raw(&self, bytes: &[u8]) -> Result<(), UdpError> {
+        self.socket.send(bytes).await?;
         Ok(())
     }
 
     pub async fn recv_updated_game(&self) -> Result<GameDto, UdpError> {
-        let mut buf = [0; 1024];
-        let (len, addr) = self.socket.recv_from(&mut buf).await?;
-        if addr != self.server_addr {
-            return Err(UdpError::InvalidSource);
+        // stack buffers cost nothing to reuse; sized with headroom so a full
+        // four-player state can never be truncated mid-datagram
+        let mut buf = [0; 2048];
+        let mut len = self.socket.recv(&mut buf).await?;
+
+        // The server broadcasts faster than the client may consume, so drain
+        // whatever queued up since the last call and only deserialize the
+        // newest state instead of rendering stale ones one frame at a time.
+        let mut spare = [0; 2048];
+        loop {
+            match self.socket.try_recv(&mut spare) {
+                Ok(spare_len) => {
+                    buf[..spare_len].copy_from_slice(&spare[..spare_len]);
+                    len = spare_len;
+                }
+                Err(ref e) if e.kind() == std::io::ErrorKind::WouldBlock => break,
+                Err(e) => return Err(e.into()),
+            }
         }
+
         let game: GameDto = rmp_serde::from_slice(&buf[..len])?;
         Ok(game)
     }
@@ -93,9 +115,9 @@ mod tests {
 
         for action in test_cases {
             let input = ClientInput {
-                game_id: Uuid::new_v4().to_string(),
-                player_id: Uuid::new_v4().to_string(),
-                action: action.clone(),
+                game_id: Uuid::new_v4(),
+                player_id: Uuid::new_v4(),
+                action,
             };
 
             client.send_client_input(input.clone()).await.unwrap();
@@ -117,8 +139,8 @@ mod tests {
         // Get client address
         client
             .send_client_input(ClientInput {
-                game_id: Uuid::new_v4().to_string(),
-                player_id: Uuid::new_v4().to_string(),
+                game_id: Uuid::new_v4(),
+                player_id: Uuid::new_v4(),
                 action: ClientInputType::Ping,
             })
             .await
@@ -203,12 +225,51 @@ mod tests {
         }
     }
 
+    #[tokio::test]
+    async fn test_drains_queued_states_to_latest() {
+        let (client, server_socket, _server_addr) = setup().await;
+        let (_, client_addr) = get_client_addr(&client, &server_socket).await;
+
+        let stale_game = GameDto {
+            id: Uuid::new_v4(),
+            state: GameState::WaitingForPlayers,
+            players: HashMap::new(),
+            ball: None,
+            created_at: chrono::Utc::now(),
+            started_at: None,
+        };
+        let fresh_game = GameDto {
+            id: Uuid::new_v4(),
+            state: GameState::Active,
+            players: HashMap::new(),
+            ball: None,
+            created_at: chrono::Utc::now(),
+            started_at: Some(chrono::Utc::now()),
+        };
+
+        // Queue two states before the client reads; only the newest counts
+        server_socket
+            .send_to(&rmp_serde::to_vec(&stale_game).unwrap(), client_addr)
+            .await
+            .unwrap();
+        server_socket
+            .send_to(&rmp_serde::to_vec(&fresh_game).unwrap(), client_addr)
+            .await
+            .unwrap();
+        tokio::time::sleep(std::time::Duration::from_millis(50)).await;
+
+        let received = client.recv_updated_game().await.unwrap();
+        assert_eq!(received.id, fresh_game.id);
+        assert_eq!(received.state, GameState::Active);
+    }
+
     #[tokio::test]
     async fn test_invalid_packet_source() {
-        let (client, _, _) = setup().await;
+        let (client, server_socket, _server_addr) = setup().await;
+        let (_, client_addr) = get_client_addr(&client, &server_socket).await;
         let rogue_server = UdpSocket::bind("127.0.0.1:0").await.unwrap();
 
-        // Send packet from rogue server
+        // Send packet from rogue server; the connected socket drops it in the kernel
         let bad_game = GameDto {
             id: Uuid::new_v4(),
             state: GameState::Finished,
@@ -217,7 +278,6 @@ mod tests {
             created_at: chrono::Utc::now(),
             started_at: None,
         };
-
         rogue_server
             .send_to(
                 &rmp_serde::to_vec(&bad_game).unwrap(),
@@ -226,10 +286,24 @@ mod tests {
             .await
             .unwrap();
 
-        match client.recv_updated_game().await {
-            Err(UdpError::InvalidSource) => (),
-            other => panic!("Expected InvalidSource error, got {:?}", other),
-        }
+        // Follow up with a legitimate packet; only this one may arrive
+        let good_game = GameDto {
+            id: Uuid::new_v4(),
+            state: GameState::WaitingForPlayers,
+            players: HashMap::new(),
+            ball: None,
+            created_at: chrono::Utc::now(),
+            started_at: None,
+        };
+        server_socket
+            .send_to(&rmp_serde::to_vec(&good_game).unwrap(), client_addr)
+            .await
+            .unwrap();
+        tokio::time::sleep(std::time::Duration::from_millis(50)).await;
+
+        let received = client.recv_updated_game().await.unwrap();
+        assert_eq!(received.id, good_game.id);
+        assert_eq!(received.state, GameState::WaitingForPlayers);
     }
 
     #[tokio::test]
@@ -268,8 +342,8 @@ mod tests {
     async fn get_client_addr(client: &UdpClient, server_socket: &UdpSocket) -> (usize, SocketAddr) {
         client
             .send_client_input(ClientInput {
-                game_id: Uuid::new_v4().to_string(),
-                player_id: Uuid::new_v4().to_string(),
+                game_id: Uuid::new_v4(),
+                player_id: Uuid::new_v4(),
                 action: ClientInputType::Ping,
             })
             .await
@@ -1,5 +1,6 @@
 use crate::client::config;
 use crate::client::error::ClientError;
+use crate::client::net::error::UdpError;
 use crate::client::net::udp::UdpClient;
 use crate::client::states::menu::Menu;
 use crate::common::models::{ClientInput, ClientInputType, Direction, GameDto, GameState};
@@ -19,6 +20,10 @@ use tokio_util::sync::CancellationToken;
 
 use uuid::Uuid;
 
+/// Minimum spacing between outgoing MovePaddle packets (~120 Hz); the server
+/// applies one paddle step per packet, so anything faster is wasted traffic
+const MOVE_SEND_INTERVAL: std::time::Duration = std::time::Duration::from_millis(8);
+
 pub struct GameBoard {
     game: Arc<Mutex<GameDto>>,
     our_player_id: Uuid,
@@ -29,6 +34,9 @@ pub struct GameBoard {
     udp_client: Arc<UdpClient>,
     config: config::Config,
     disconnected: Arc<AtomicBool>,
+    move_positive: Vec<u8>,
+    move_negative: Vec<u8>,
+    last_move_sent: Option<std::time::Instant>,
 }
 
 impl GameBoard {
@@ -44,6 +52,29 @@ impl GameBoard {
             .get(&our_player_id)
             .map(|player| player.position.unwrap_or(PlayerPosition::Left))
             .unwrap_or(PlayerPosition::Left);
+
+        // both MovePaddle packets are constant for the whole session,
+        // so serialize them once instead of on every keypress
+        let move_positive = rmp_serde::to_vec(&ClientInput::new(
+            game.id,
+            our_player_id,
+            ClientInputType::MovePaddle(Direction::Positive),
+        ))
+        .map_err(UdpError::from)?;
+        let move_negative = rmp_serde::to_vec(&ClientInput::new(
+            game.id,
+            our_player_id,
+            ClientInputType::MovePaddle(Direction::Negative),
+        ))
+        .map_err(UdpError::from)?;
+        // the ping payload never changes either, encode it once as well
+        let ping_packet = rmp_serde::to_vec(&ClientInput::new(
+            game.id,
+            our_player_id,
+            ClientInputType::Ping,
+        ))
+        .map_err(UdpError::from)?;
+
         let game = Arc::new(Mutex::new(game));
         let cancellation_token = CancellationToken::new();
         let disconnected = Arc::new(AtomicBool::new(false));
@@ -81,25 +112,14 @@ impl GameBoard {
 
         let udp_client_clone = Arc::clone(&udp_client);
         let cancellation_token_clone = cancellation_token.clone();
-        let game_clone = Arc::clone(&game);
         let ping_handle = tokio::spawn(async move {
             let ping_interval = std::time::Duration::from_secs(1);
             loop {
                 tokio::time::sleep(ping_interval).await;
-                let client_input = if let Ok(g) = game_clone.lock() {
-                    ClientInput::new(
-                        g.id.to_string(),
-                        our_player_id.to_string(),
-                        ClientInputType::Ping,
-                    )
-                } else {
-                    error!("Failed to lock game");
-                    continue;
-                };
 
                 tokio::select! {
                     _ = cancellation_token_clone.cancelled() => break,
-                    _ = udp_client_clone.send_client_input(client_input) => {
+                    _ = udp_client_clone.send_raw(&ping_packet) => {
                         debug!("Ping sent");
                     }
                 }
@@ -116,20 +136,30 @@ impl GameBoard {
             udp_client,
             config,
             disconnected,
+            move_positive,
+            move_negative,
+            last_move_sent: None,
         })
     }
 
-    fn create_move_input(&self, direction: Direction) -> Option<ClientInput> {
-        if let Ok(game) = self.game.lock() {
-            Some(ClientInput::new(
-                game.id.to_string(),
-                self.our_player_id.to_string(),
-                ClientInputType::MovePaddle(direction),
-            ))
-        } else {
-            error!("Failed to lock game");
-            None
+    async fn send_move(&mut self, direction: Direction) {
+        // coalesce key-repeat floods into at most one packet per interval
+        if self
+            .last_move_sent
+            .is_some_and(|sent| sent.elapsed() < MOVE_SEND_INTERVAL)
+        {
+            return;
         }
+        self.last_move_sent = Some(std::time::Instant::now());
+
+        let packet = match direction {
+            Direction::Positive => &self.move_positive,
+            Direction::Negative => &self.move_negative,
+        };
+        self.udp_client
+            .send_raw(packet)
+            .await
+            .unwrap_or_else(|e| error!("Failed to send move input: {}", e));
     }
 }
 
@@ -173,39 +203,19 @@ impl Update for GameBoard {
                 _ => match self.our_player_position {
                     PlayerPosition::Left | PlayerPosition::Right => match key_code {
                         KeyCode::Up | KeyCode::Char('w') | KeyCode::Char('W') => {
-                            if let Some(input) = self.create_move_input(Direction::Negative) {
-                                self.udp_client
-                                    .send_client_input(input)
-                                    .await
-                                    .unwrap_or_else(|e| error!("Failed to send move input: {}", e));
-                            }
+                            self.send_move(Direction::Negative).await;
                         }
                         KeyCode::Down | KeyCode::Char('s') | KeyCode::Char('S') => {
-                            if let Some(input) = self.create_move_input(Direction::Positive) {
-                                self.udp_client
-                                    .send_client_input(input)
-                                    .await
-                                    .unwrap_or_else(|e| error!("Failed to send move input: {}", e));
-                            }
+                            self.send_move(Direction::Positive).await;
                         }
                         _ => {}
                     },
                     PlayerPosition::Top | PlayerPosition::Bottom => match key_code {
                         KeyCode::Right | KeyCode::Char('d') | KeyCode::Char('D') => {
-                            if let Some(input) = self.create_move_input(Direction::Positive) {
-                                self.udp_client
-                                    .send_client_input(input)
-                                    .await
-                                    .unwrap_or_else(|e| error!("Failed to send move input: {}", e));
-                            }
+                            self.send_move(Direction::Positive).await;
                         }
                         KeyCode::Left | KeyCode::Char('a') | KeyCode::Char('A') => {
-                            if let Some(input) = self.create_move_input(Direction::Negative) {
-                                self.udp_client
-                                    .send_client_input(input)
-                                    .await
-                                    .unwrap_or_else(|e| error!("Failed to send move input: {}", e));
-                            }
+                            self.send_move(Direction::Negative).await;
                         }
                         _ => {}
                     },
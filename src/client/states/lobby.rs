@@ -3,6 +3,7 @@ use std::sync::{Arc, Mutex};
 
 use crate::client::config;
 use crate::client::error::ClientError;
+use crate::client::net::error::UdpError;
 use crate::client::net::tcp::TcpClient;
 use crate::client::net::udp::UdpClient;
 use crate::common::models::{ClientInput, ClientInputType, GameDto, GameState};
@@ -28,6 +29,7 @@ use uuid::Uuid;
 pub struct Lobby {
     game: Arc<Mutex<GameDto>>,
     game_id: Uuid,
+    game_id_text: String,
     our_player_id: Uuid,
     cancellation_token: CancellationToken,
     _receive_update_handle: JoinHandle<Result<(), ClientError>>,
@@ -60,11 +62,7 @@ impl Lobby {
         let disconnected_clone = Arc::clone(&disconnected);
         let receive_update_handle = tokio::spawn(async move {
             // send introduction message
-            let client_input = ClientInput::new(
-                game_id.to_string(),
-                our_player_id.to_string(),
-                ClientInputType::JoinGame,
-            );
+            let client_input = ClientInput::new(game_id, our_player_id, ClientInputType::JoinGame);
             udp_client_clone.send_client_input(client_input).await?;
 
             loop {
@@ -94,21 +92,23 @@ impl Lobby {
         });
 
         // Start a task to send ping messages
+        // the ping payload never changes, so encode it once up front
+        let ping_packet = rmp_serde::to_vec(&ClientInput::new(
+            game_id,
+            our_player_id,
+            ClientInputType::Ping,
+        ))
+        .map_err(UdpError::from)?;
         let udp_client_clone = Arc::clone(&udp_client);
         let cancellation_token_clone = cancellation_token.clone();
         let ping_handle = tokio::spawn(async move {
             let ping_interval = std::time::Duration::from_secs(1);
             loop {
                 tokio::time::sleep(ping_interval).await;
-                let client_input = ClientInput::new(
-                    game_id.to_string(),
-                    our_player_id.to_string(),
-                    ClientInputType::Ping,
-                );
 
                 tokio::select! {
                     _ = cancellation_token_clone.cancelled() => break,
-                    _ = udp_client_clone.send_client_input(client_input) => {
+                    _ = udp_client_clone.send_raw(&ping_packet) => {
                         debug!("Sent ping message");
                     }
                 }
@@ -118,6 +118,8 @@ impl Lobby {
         Ok(Self {
             game: game_dto,
             game_id,
+            // formatting a Uuid hex-encodes it, so do that once instead of per frame
+            game_id_text: format!(" Game ID - {}", game_id),
             our_player_id,
             udp_client,
             tcp_client,
@@ -177,8 +179,8 @@ impl Update for Lobby {
                 KeyCode::Enter => {
                     // send player ready
                     let client_input = ClientInput::new(
-                        self.game_id.to_string(),
-                        self.our_player_id.to_string(),
+                        self.game_id,
+                        self.our_player_id,
                         ClientInputType::PlayerReady,
                     );
                     self.udp_client.send_client_input(client_input).await?;
@@ -263,7 +265,7 @@ impl Render for Lobby {
                 Line::from(vec![" Copy ".into(), "<TAB> ".green().bold()]).right_aligned(),
             );
             let inner_lobby_id_area = lobby_id_block.inner(lobby_id_area);
-            let lobby_id_paragraph = Paragraph::new(format!(" Game ID - {}", game.id));
+            let lobby_id_paragraph = Paragraph::new(self.game_id_text.as_str());
             frame.render_widget(lobby_id_paragraph, inner_lobby_id_area);
             frame.render_widget(lobby_id_block, lobby_id_area);
 
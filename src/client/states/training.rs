@@ -104,7 +104,7 @@ impl Update for Training {
                 info!("Game finished");
                 info!("Moving from Training to GameEnd");
                 return Ok(Some(Box::new(GameEnd::new(
-                    GameDto::from(game.clone()),
+                    GameDto::from(&*game),
                     self.our_player_id,
                     self.config.clone(),
                 )?)));
@@ -165,7 +165,7 @@ impl Render for Training {
     fn render(&self, frame: &mut Frame) {
         if let Ok(game) = self.game.lock() {
             render_game(
-                &GameDto::from(game.clone()),
+                &GameDto::from(&*game),
                 self.our_player_id,
                 self.config.player_color,
                 self.config.other_players_color,
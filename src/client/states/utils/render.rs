@@ -309,107 +309,80 @@ pub fn calculate_game_area(frame: &Frame) -> (Rect, Rect, f32, f32) {
 /// Render a single player's paddle
 pub fn render_player(
     player: &PlayerDto,
-    player_color: ratatui::style::Color,
+    player_style: Style,
     frame: &mut Frame,
     game_area: &Rect,
     scale_x: f32,
     scale_y: f32,
 ) {
-    const PLAYER_VERTICAL_BODY: &str = "█";
+    const PLAYER_VERTICAL_BODY: &str = "█\n";
     const PLAYER_UP_BODY: &str = "▄";
     const PLAYER_BOTTOM_BODY: &str = "▀";
+    const PADDLE_THICKNESS: u16 = 1; // Paddle depth is 1 character
 
-    let player_style = ratatui::style::Style::default().fg(player_color);
+    let position = match player.position {
+        Some(position) => position,
+        None => return,
+    };
 
-    match player.position {
-        Some(PlayerPosition::Top) | Some(PlayerPosition::Bottom) => {
+    // Resolve the per-side body and rectangle with a single dispatch on the
+    // position instead of re-matching it inside each branch
+    let (body, rect) = match position {
+        PlayerPosition::Top | PlayerPosition::Bottom => {
             // Calculate horizontal paddle dimensions and position
             let paddle_length = (player.paddle_width * scale_x) as u16;
-            let paddle_thickness = 1; // Paddle depth is 1 character
-
             let paddle_center = (player.paddle_position * scale_x) as u16;
             let paddle_x = game_area
                 .x
                 .saturating_add(paddle_center)
                 .saturating_sub(paddle_length / 2);
-            match player.position {
-                Some(PlayerPosition::Top) => {
-                    let paddle_y = game_area.y;
-                    frame.render_widget(
-                        Paragraph::new(PLAYER_UP_BODY.repeat(paddle_length as usize))
-                            .style(player_style),
-                        Rect {
-                            x: paddle_x,
-                            y: paddle_y,
-                            width: paddle_length,
-                            height: paddle_thickness,
-                        },
-                    );
-                }
-                Some(PlayerPosition::Bottom) => {
-                    let paddle_y = game_area.y + game_area.height - paddle_thickness;
-                    frame.render_widget(
-                        Paragraph::new(PLAYER_BOTTOM_BODY.repeat(paddle_length as usize))
-                            .style(player_style),
-                        Rect {
-                            x: paddle_x,
-                            y: paddle_y,
-                            width: paddle_length,
-                            height: paddle_thickness,
-                        },
-                    );
-                }
-                _ => {}
-            }
+            let (body, paddle_y) = if position == PlayerPosition::Top {
+                (PLAYER_UP_BODY, game_area.y)
+            } else {
+                (
+                    PLAYER_BOTTOM_BODY,
+                    game_area.y + game_area.height - PADDLE_THICKNESS,
+                )
+            };
+            (
+                body.repeat(paddle_length as usize),
+                Rect {
+                    x: paddle_x,
+                    y: paddle_y,
+                    width: paddle_length,
+                    height: PADDLE_THICKNESS,
+                },
+            )
         }
-        Some(PlayerPosition::Left) | Some(PlayerPosition::Right) => {
+        PlayerPosition::Left | PlayerPosition::Right => {
             // Calculate vertical paddle dimensions and position
             let paddle_length = (player.paddle_width * scale_y) as u16;
-            let paddle_thickness = 1; // Paddle depth is 1 character
             let paddle_center = (player.paddle_position * scale_y) as u16;
             let paddle_y = game_area
                 .y
                 .saturating_add(paddle_center)
                 .saturating_sub(paddle_length / 2);
-            match player.position {
-                Some(PlayerPosition::Left) => {
-                    let paddle_x = game_area.x;
-                    frame.render_widget(
-                        Paragraph::new(
-                            format!("{}\n", PLAYER_VERTICAL_BODY).repeat(paddle_length as usize),
-                        )
-                        .style(player_style),
-                        Rect {
-                            x: paddle_x,
-                            y: paddle_y,
-                            width: paddle_thickness,
-                            height: paddle_length,
-                        },
-                    );
-                }
-                Some(PlayerPosition::Right) => {
-                    let paddle_x = game_area
-                        .x
-                        .saturating_add(game_area.width)
-                        .saturating_sub(paddle_thickness);
-                    frame.render_widget(
-                        Paragraph::new(
-                            format!("{}\n", PLAYER_VERTICAL_BODY).repeat(paddle_length as usize),
-                        )
-                        .style(player_style),
-                        Rect {
-                            x: paddle_x,
-                            y: paddle_y,
-                            width: paddle_thickness,
-                            height: paddle_length,
-                        },
-                    );
-                }
-                _ => {}
-            }
+            let paddle_x = if position == PlayerPosition::Left {
+                game_area.x
+            } else {
+                game_area
+                    .x
+                    .saturating_add(game_area.width)
+                    .saturating_sub(PADDLE_THICKNESS)
+            };
+            (
+                PLAYER_VERTICAL_BODY.repeat(paddle_length as usize),
+                Rect {
+                    x: paddle_x,
+                    y: paddle_y,
+                    width: PADDLE_THICKNESS,
+                    height: paddle_length,
+                },
+            )
         }
-        None => {}
-    }
+    };
+
+    frame.render_widget(Paragraph::new(body).style(player_style), rect);
 }
 
 /// Render the ball
@@ -420,18 +393,21 @@ pub fn render_ball(
     scale_x: f32,
     scale_y: f32,
 ) {
-    // Calculate ball position in terminal coordinates
+    // Calculate ball position in terminal coordinates, clamped into the game
+    // area so a ball at the far edge never lands on the border cells
     let ball_x = game_area
         .x
-        .saturating_add((ball.position.x * scale_x) as u16);
+        .saturating_add((ball.position.x * scale_x) as u16)
+        .min(game_area.right().saturating_sub(1));
     let ball_y = game_area
         .y
-        .saturating_add((ball.position.y * scale_y) as u16);
+        .saturating_add((ball.position.y * scale_y) as u16)
+        .min(game_area.bottom().saturating_sub(1));
 
     // Render the ball as a single character
+    const BALL_STYLE: Style = Style::new().fg(Color::White);
     frame.render_widget(
-        Paragraph::new("●")
-            .style(ratatui::style::Style::default().fg(ratatui::style::Color::White)),
+        Paragraph::new("●").style(BALL_STYLE),
         Rect {
             x: ball_x,
             y: ball_y,
@@ -454,13 +430,18 @@ pub fn render_game(
     // Render the game area border
     frame.render_widget(Block::bordered(), game_area_bounding_box);
 
-    // Render players scores
+    // Build the two paddle styles once per frame instead of per player
+    let our_style = Style::default().fg(player_color);
+    let other_style = Style::default().fg(other_players_color);
+
+    // Render each player's score and paddle in a single pass
+    let frame_area = frame.area();
     for player in game.players.values() {
         let desc = format!(" {} {} ", player.name, player.score);
         let desc_len = desc
             .len()
-            .min(frame.area().width as usize)
-            .min(frame.area().height as usize) as u16; // Limit to the frame size
+            .min(frame_area.width as usize)
+            .min(frame_area.height as usize) as u16; // Limit to the frame size
 
         match player.position {
             Some(PlayerPosition::Top) => {
@@ -509,16 +490,13 @@ pub fn render_game(
             }
             None => {}
         }
-    }
 
-    // Render players
-    for player in game.players.values() {
-        let player_color = if player.id == our_player_id {
-            player_color
+        let style = if player.id == our_player_id {
+            our_style
         } else {
-            other_players_color
+            other_style
         };
-        render_player(player, player_color, frame, &game_area, scale_x, scale_y);
+        render_player(player, style, frame, &game_area, scale_x, scale_y);
     }
 
     // Render the ball
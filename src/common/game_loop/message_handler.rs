@@ -1,8 +1,7 @@
 use std::{net::SocketAddr, sync::Arc};
 
-use log::{debug, error, info};
+use log::{debug, error, info, trace};
 use tokio::sync::Mutex;
-use uuid::Uuid;
 
 use crate::common::{
     models::{Ball, ClientInput, ClientInputType, GameState},
@@ -18,20 +17,14 @@ fn validate_game_state(action: &ClientInputType, game_state: &GameState) -> bool
 }
 
 pub async fn process_input(input: ClientInput, lobbies: Arc<Mutex<GameRooms>>, addr: SocketAddr) {
-    let (game_id, player_id) = match (
-        Uuid::parse_str(&input.game_id),
-        Uuid::parse_str(&input.player_id),
-    ) {
-        (Ok(game_id), Ok(player_id)) => (game_id, player_id),
-        _ => {
-            info!("Invalid UUIDs of game_id or player_id");
-            return;
-        }
-    };
+    let (game_id, player_id) = (input.game_id, input.player_id);
 
-    info!(
+    // this fires for every datagram (up to once per paddle move per tick),
+    // so keep it below the configured log level
+    trace!(
         "Processing input from player {} for game {}",
-        player_id, game_id
+        player_id,
+        game_id
     );
 
     let mut game_rooms = lobbies.lock().await;
@@ -1,8 +1,9 @@
 use std::net::SocketAddr;
 
 use serde::{Deserialize, Serialize};
+use uuid::Uuid;
 
-#[derive(Serialize, Debug, Deserialize, PartialEq, Clone)]
+#[derive(Serialize, Debug, Deserialize, PartialEq, Clone, Copy)]
 pub enum ClientInputType {
     JoinGame,
     PauseGame,
@@ -13,7 +14,7 @@ pub enum ClientInputType {
     Ping,
 }
 
-#[derive(Serialize, Deserialize, Debug, PartialEq, Clone)]
+#[derive(Serialize, Deserialize, Debug, PartialEq, Clone, Copy)]
 pub enum Direction {
     Positive,
     Negative,
@@ -21,13 +22,13 @@ pub enum Direction {
 
 #[derive(Serialize, Deserialize, Debug, Clone)]
 pub struct ClientInput {
-    pub game_id: String,
-    pub player_id: String,
+    pub game_id: Uuid,
+    pub player_id: Uuid,
     pub action: ClientInputType,
 }
 
 impl ClientInput {
-    pub fn new(game_id: String, player_id: String, action: ClientInputType) -> Self {
+    pub fn new(game_id: Uuid, player_id: Uuid, action: ClientInputType) -> Self {
         Self {
             game_id,
             player_id,
@@ -18,3 +18,13 @@ impl From<Ball> for BallDto {
         }
     }
 }
+
+impl From<&Ball> for BallDto {
+    fn from(ball: &Ball) -> Self {
+        BallDto {
+            position: ball.position.clone(),
+            velocity: ball.velocity.clone(),
+            radius: ball.radius,
+        }
+    }
+}
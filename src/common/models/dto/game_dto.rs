@@ -33,3 +33,20 @@ impl From<Game> for GameDto {
         }
     }
 }
+
+impl From<&Game> for GameDto {
+    fn from(game: &Game) -> Self {
+        GameDto {
+            id: game.id,
+            state: game.state.clone(),
+            created_at: game.created_at,
+            started_at: game.started_at,
+            ball: game.ball.as_ref().map(BallDto::from),
+            players: game
+                .players
+                .iter()
+                .map(|(id, player)| (*id, PlayerDto::from(player)))
+                .collect(),
+        }
+    }
+}
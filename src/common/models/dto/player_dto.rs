@@ -31,3 +31,19 @@ impl From<Player> for PlayerDto {
         }
     }
 }
+
+impl From<&Player> for PlayerDto {
+    fn from(player: &Player) -> Self {
+        PlayerDto {
+            id: player.id,
+            name: player.name.clone(),
+            joined_at: player.joined_at,
+            score: player.score,
+            position: player.position,
+            paddle_position: player.paddle_position,
+            paddle_delta: player.paddle_delta,
+            paddle_width: player.paddle_width,
+            is_ready: player.is_ready,
+        }
+    }
+}
@@ -64,7 +64,7 @@ impl Game {
     }
 
     pub fn to_network_bytes(&self) -> Result<Vec<u8>, rmp_serde::encode::Error> {
-        let dto = GameDto::from(self.clone());
+        let dto = GameDto::from(self);
         rmp_serde::to_vec(&dto)
     }
 
@@ -291,119 +291,81 @@ impl Game {
                 return;
             }
             for player in self.players.values_mut() {
-                match player.position {
-                    Some(PlayerPosition::Top) => {
-                        let paddle_start = player.paddle_position - player.paddle_width / 2.0;
-                        let paddle_end = player.paddle_position + player.paddle_width / 2.0;
-                        let paddle_y = PADDLE_PADDING;
-
-                        let next_ball_y = ball.position.y + ball.velocity.y;
-
-                        // Check if the ball will collide with the paddle
-                        if next_ball_y < paddle_y
-                            && (ball.position.x + ball.radius) >= paddle_start
-                            && (ball.position.x - ball.radius) <= paddle_end
-                        {
-                            let hit_offset = ((ball.position.x - player.paddle_position)
-                                / (player.paddle_width / 2.0))
-                                .clamp(-1.0, 1.0);
-
-                            let angle = (3.0 * PI / 2.0) + hit_offset * MAX_ANGLE;
-
-                            // Update the ball's velocity based on the reflection angle
-                            ball.velocity.x = BALL_SPEED * angle.cos();
-                            ball.velocity.y = -BALL_SPEED * angle.sin();
-
-                            ball.position.y = paddle_y + ball.radius;
-
-                            ball.last_touched_by = Some(player.id);
-                        }
-                    }
-                    Some(PlayerPosition::Bottom) => {
-                        let paddle_start = player.paddle_position - player.paddle_width / 2.0;
-                        let paddle_end = player.paddle_position + player.paddle_width / 2.0;
-                        let paddle_y = GAME_SIZE - PADDLE_PADDING;
-
-                        let next_ball_y = ball.position.y + ball.velocity.y;
-
-                        // Check if the ball will collide with the paddle
-                        if next_ball_y > paddle_y
-                            && (ball.position.x + ball.radius) >= paddle_start
-                            && (ball.position.x - ball.radius) <= paddle_end
-                        {
-                            let hit_offset = -((ball.position.x - player.paddle_position)
-                                / (player.paddle_width / 2.0))
-                                .clamp(-1.0, 1.0);
-
-                            let angle = (PI / 2.0) + hit_offset * MAX_ANGLE;
-
-                            ball.velocity.x = BALL_SPEED * angle.cos();
-                            ball.velocity.y = -BALL_SPEED * angle.sin();
-
-                            ball.position.y = paddle_y - ball.radius;
-
-                            ball.last_touched_by = Some(player.id);
-                        }
-                    }
-                    Some(PlayerPosition::Left) => {
-                        let paddle_start = player.paddle_position - player.paddle_width / 2.0;
-                        let paddle_end = player.paddle_position + player.paddle_width / 2.0;
-                        let paddle_x = PADDLE_PADDING;
-
-                        let next_ball_x = ball.position.x + ball.velocity.x;
-
-                        // Check if the ball will collide with the paddle
-                        if next_ball_x < paddle_x
-                            && (ball.position.y + ball.radius) >= paddle_start
-                            && (ball.position.y - ball.radius) <= paddle_end
-                        {
-                            let hit_offset = -((ball.position.y - player.paddle_position)
-                                / (player.paddle_width / 2.0))
-                                .clamp(-1.0, 1.0);
-
-                            let angle = (PI) + hit_offset * MAX_ANGLE;
-
-                            ball.velocity.x = -BALL_SPEED * angle.cos();
-                            ball.velocity.y = BALL_SPEED * angle.sin();
-
-                            ball.position.x = paddle_x + ball.radius;
-
-                            ball.last_touched_by = Some(player.id);
-                        }
+                let position = match player.position {
+                    Some(position) => position,
+                    None => continue,
+                };
+                let (horizontal, wall, near_side, offset_sign, base_angle) =
+                    collision_params(position);
+
+                let half_width = player.paddle_width / 2.0;
+                let paddle_start = player.paddle_position - half_width;
+                let paddle_end = player.paddle_position + half_width;
+
+                // ball coordinates split into the axis towards the wall and
+                // the axis the paddle moves along
+                let (depth_pos, depth_vel, along_pos) = if horizontal {
+                    (ball.position.y, ball.velocity.y, ball.position.x)
+                } else {
+                    (ball.position.x, ball.velocity.x, ball.position.y)
+                };
+
+                let next_depth = depth_pos + depth_vel;
+                let crosses_wall = if near_side {
+                    next_depth < wall
+                } else {
+                    next_depth > wall
+                };
+
+                // Check if the ball will collide with the paddle
+                if crosses_wall
+                    && (along_pos + ball.radius) >= paddle_start
+                    && (along_pos - ball.radius) <= paddle_end
+                {
+                    let hit_offset = (offset_sign * (along_pos - player.paddle_position)
+                        / half_width)
+                        .clamp(-1.0, 1.0);
+
+                    let angle = base_angle + hit_offset * MAX_ANGLE;
+
+                    let rebound = if near_side {
+                        wall + ball.radius
+                    } else {
+                        wall - ball.radius
+                    };
+
+                    // Update the ball's velocity based on the reflection angle
+                    if horizontal {
+                        ball.velocity.x = BALL_SPEED * angle.cos();
+                        ball.velocity.y = -BALL_SPEED * angle.sin();
+                        ball.position.y = rebound;
+                    } else {
+                        ball.velocity.x = -BALL_SPEED * angle.cos();
+                        ball.velocity.y = BALL_SPEED * angle.sin();
+                        ball.position.x = rebound;
                     }
-                    Some(PlayerPosition::Right) => {
-                        let paddle_start = player.paddle_position - player.paddle_width / 2.0;
-                        let paddle_end = player.paddle_position + player.paddle_width / 2.0;
-                        let paddle_x = GAME_SIZE - PADDLE_PADDING;
-
-                        let next_ball_x = ball.position.x + ball.velocity.x;
-
-                        // Check if the ball will collide with the paddle
-                        if next_ball_x > paddle_x
-                            && (ball.position.y + ball.radius) >= paddle_start
-                            && (ball.position.y - ball.radius) <= paddle_end
-                        {
-                            let hit_offset = ((ball.position.y - player.paddle_position)
-                                / (player.paddle_width / 2.0))
-                                .clamp(-1.0, 1.0);
-
-                            let angle = (2.0 * PI) + hit_offset * MAX_ANGLE;
 
-                            ball.velocity.x = -BALL_SPEED * angle.cos();
-                            ball.velocity.y = BALL_SPEED * angle.sin();
-
-                            ball.position.x = paddle_x - ball.radius;
-
-                            ball.last_touched_by = Some(player.id);
-                        }
-                    }
-                    None => {}
+                    ball.last_touched_by = Some(player.id);
                 }
             }
         }
     }
 }
 
+/// Per-side collision parameters as
+/// `(horizontal, wall, near_side, hit_offset_sign, base_angle)`, where
+/// `horizontal` says the paddle moves along the x axis, `wall` is the paddle
+/// plane coordinate and `near_side` whether that plane sits at the low end of
+/// the board.
+fn collision_params(position: PlayerPosition) -> (bool, f32, bool, f32, f32) {
+    match position {
+        PlayerPosition::Top => (true, PADDLE_PADDING, true, 1.0, 3.0 * PI / 2.0),
+        PlayerPosition::Bottom => (true, GAME_SIZE - PADDLE_PADDING, false, -1.0, PI / 2.0),
+        PlayerPosition::Left => (false, PADDLE_PADDING, true, -1.0, PI),
+        PlayerPosition::Right => (false, GAME_SIZE - PADDLE_PADDING, false, 1.0, 2.0 * PI),
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -574,6 +536,70 @@ mod tests {
         assert_eq!(game.players.len(), 0);
     }
 
+    #[test]
+    fn test_check_collision_top_paddle() {
+        let mut game = Game::new();
+        let mut player = Player::new("Player 1".to_string(), false);
+        player.position = Some(PlayerPosition::Top);
+        player.paddle_position = 5.0;
+        let player_id = player.id;
+        game.add_player(player).unwrap();
+
+        let mut ball = Ball::new();
+        ball.position = Vec2 { x: 5.0, y: 0.3 };
+        ball.velocity = Vec2 { x: 0.0, y: -0.15 };
+        game.ball = Some(ball);
+
+        game.check_collision();
+
+        let ball = game.ball.as_ref().unwrap();
+        assert!(ball.velocity.y > 0.0); // reflected back into the board
+        assert_eq!(ball.position.y, PADDLE_PADDING + ball.radius);
+        assert_eq!(ball.last_touched_by, Some(player_id));
+    }
+
+    #[test]
+    fn test_check_collision_right_paddle() {
+        let mut game = Game::new();
+        let mut player = Player::new("Player 1".to_string(), false);
+        player.position = Some(PlayerPosition::Right);
+        player.paddle_position = 5.0;
+        let player_id = player.id;
+        game.add_player(player).unwrap();
+
+        let mut ball = Ball::new();
+        ball.position = Vec2 { x: 9.7, y: 5.0 };
+        ball.velocity = Vec2 { x: 0.15, y: 0.0 };
+        game.ball = Some(ball);
+
+        game.check_collision();
+
+        let ball = game.ball.as_ref().unwrap();
+        assert!(ball.velocity.x < 0.0); // reflected back into the board
+        assert_eq!(ball.position.x, GAME_SIZE - PADDLE_PADDING - ball.radius);
+        assert_eq!(ball.last_touched_by, Some(player_id));
+    }
+
+    #[test]
+    fn test_check_collision_misses_paddle() {
+        let mut game = Game::new();
+        let mut player = Player::new("Player 1".to_string(), false);
+        player.position = Some(PlayerPosition::Top);
+        player.paddle_position = 1.0;
+        game.add_player(player).unwrap();
+
+        let mut ball = Ball::new();
+        ball.position = Vec2 { x: 5.0, y: 0.3 };
+        ball.velocity = Vec2 { x: 0.0, y: -0.15 };
+        game.ball = Some(ball);
+
+        game.check_collision();
+
+        let ball = game.ball.as_ref().unwrap();
+        assert!(ball.velocity.y < 0.0); // untouched, still heading for the wall
+        assert_eq!(ball.last_touched_by, None);
+    }
+
     #[test]
     fn test_is_ball_in_safe_zone() {
         let ball = Ball::new();